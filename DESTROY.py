@@ -1,5 +1,7 @@
 import os
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import typer
 from rich.console import Console
 from rich.prompt import Prompt
@@ -7,14 +9,63 @@ from rich.prompt import Prompt
 app = typer.Typer()
 console = Console()
 
+RM = shutil.which("rm") if os.name != "nt" else None
+
 def remove_if_exists(path):
     """Safely remove a file or directory if it exists."""
-    if os.path.isfile(path):
-        os.remove(path)
-        console.print(f"[red]Removed file: {path}[/red]")
-    elif os.path.isdir(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        return
+    except OSError:
+        # Directories can't be unlinked (EISDIR on Linux, EPERM elsewhere)
+        if not os.path.isdir(path):
+            raise
         shutil.rmtree(path)
         console.print(f"[red]Removed directory: {path}[/red]")
+    else:
+        console.print(f"[red]Removed file: {path}[/red]")
+
+def remove_tree(path):
+    """Remove a directory tree and return any paths that could not be deleted.
+
+    Errors are collected rather than printed so nothing is rendered per entry.
+    """
+    if RM:
+        result = subprocess.run([RM, "-rf", "--", path], stderr=subprocess.DEVNULL, check=False)
+        return [path] if result.returncode else []
+
+    # Where `rm` exists, trees go through `rm -rf` above, which already
+    # unlinks with unlinkat() relative to open directory fds. This fallback
+    # covers Windows, where rmtree has no dir_fd walk, and POSIX systems
+    # without `rm`, where rmtree uses its own fd-relative walk.
+    failed = []
+    shutil.rmtree(path, onerror=lambda func, failed_path, exc_info: failed.append(failed_path))
+    return failed
+
+def fast_remove(files, dirs):
+    """Remove existing files inline and directory trees concurrently."""
+    for path in files:
+        remove_if_exists(path)
+
+    dirs = [path for path in dirs if os.path.lexists(path)]
+    if not dirs:
+        return
+
+    # Directory trees are independent, so delete them in parallel and report
+    # each one from the main thread as it finishes.
+    failures = []
+    with ThreadPoolExecutor(max_workers=min(8, len(dirs))) as executor:
+        futures = {executor.submit(remove_tree, path): path for path in dirs}
+        for future in as_completed(futures):
+            failed = future.result()
+            if failed:
+                failures.extend(failed)
+            else:
+                console.print(f"[red]Removed directory: {futures[future]}[/red]")
+
+    if failures:
+        console.print(f"[yellow]Could not remove {len(failures)} path(s), e.g. {failures[0]}[/yellow]")
 
 @app.command()
 def destroy():
@@ -55,13 +106,8 @@ def destroy():
     
     console.print("\n[bold red]Initiating destruction sequence...[/bold red]")
     
-    # Remove files
-    for file in files_to_remove:
-        remove_if_exists(file)
-    
-    # Remove directories
-    for directory in dirs_to_remove:
-        remove_if_exists(directory)
+    # Remove files, then directory trees in parallel
+    fast_remove(files_to_remove, dirs_to_remove)
     
     console.print("\n[bold red]Destruction complete![/bold red]")
 
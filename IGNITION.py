@@ -1,18 +1,19 @@
+import importlib.util
 import os
 import shutil
 import subprocess
 import sys
 import time
 from pathlib import Path
+from string import Template
 
 def install_required_packages():
     required = ['typer', 'rich']
-    for package in required:
-        try:
-            __import__(package)
-        except ImportError:
-            print(f"Installing required package: {package}")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+    # find_spec only looks the packages up; it doesn't import them
+    missing = [package for package in required if importlib.util.find_spec(package) is None]
+    if missing:
+        print(f"Installing required packages: {', '.join(missing)}")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
 
 # Install required packages before imports
 install_required_packages()
@@ -27,6 +28,13 @@ from rich import print as rprint
 app = typer.Typer()                                                                                      
 console = Console()                                                                                      
 
+# Use uv for the venv and installs when it is available
+UV = shutil.which("uv")
+
+# Interpreter inside the project venv; pip and django are run via -m
+VENV_BIN = Path("venv") / ("Scripts" if os.name == "nt" else "bin")
+VENV_PYTHON = str(VENV_BIN / ("python.exe" if os.name == "nt" else "python"))
+
 # KEEP THESE IMPORTANT COMMENTS - DO NOT REMOVE
 # - Use 'config' as the project configuration directory
 # - Dynamically name the main app based on user input
@@ -57,11 +65,30 @@ EXPLOSION_ART = """
     🚀 BLAST OFF! 🚀
 """                                                                                   
                                                                                                         
-def create_virtual_environment():                                                                        
-    """Create and activate virtual environment."""                                                       
-    with console.status("[bold green]Creating virtual environment...") as status:                        
-        subprocess.run([sys.executable, "-m", "venv", "venv"], check=True)                               
-        console.print("[green]✓[/green] Virtual environment created")                                    
+def venv_command():
+    """Return the command that creates ./venv, preferring uv when installed."""
+    if UV:
+        # Seed pip so a plain `pip install` inside the activated venv works
+        return [UV, "venv", "--seed", "--python", sys.executable, "venv"]
+    return [sys.executable, "-m", "venv", "venv"]
+
+def start_virtual_environment():
+    """Start creating the virtual environment in the background."""
+    # Capture the output so it doesn't draw over the countdown; it is shown
+    # by create_virtual_environment if the venv could not be created
+    return subprocess.Popen(venv_command(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+def create_virtual_environment(venv_proc=None):
+    """Create and activate virtual environment, or wait on one already started."""
+    with console.status("[bold green]Creating virtual environment...") as status:
+        if venv_proc is None:
+            subprocess.run(venv_command(), check=True)
+        else:
+            output, _ = venv_proc.communicate()
+            if venv_proc.returncode != 0:
+                console.print(output.decode(errors='replace'), style="red", markup=False)
+                raise subprocess.CalledProcessError(venv_proc.returncode, venv_proc.args)
+        console.print("[green]✓[/green] Virtual environment created")
                                                                                                         
 def install_dependencies():                                                                              
     """Install required packages."""                                                                     
@@ -82,56 +109,78 @@ def install_dependencies():
         "pytest-django"
     ]                                                                                                    
                                                                                                         
-    with Progress(                                                                                       
-        SpinnerColumn(),                                                                                 
-        TextColumn("[progress.description]{task.description}"),                                          
-        transient=True,                                                                                  
-    ) as progress:                                                                                       
+    # Only animate the spinner on an interactive terminal, and keep its
+    # repaint rate low since pip is doing all the real work
+    interactive = sys.stdout.isatty() and not os.environ.get("CI")
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        transient=True,
+        refresh_per_second=4,
+        disable=not interactive,
+    ) as progress:
         task = progress.add_task("[cyan]Installing dependencies...", total=None)                         
                                                                                                         
-        # Try both approaches for maximum reliability
-        venv_pip = "./venv/bin/pip" if os.name != "nt" else r".\venv\Scripts\pip"
-        
-        # Install Django first to ensure django-admin is available
+        # Write requirements up front so pip resolves everything in one pass
+        with open("requirements.txt", "w") as f:
+            f.write("\n".join(requirements))
+
+        # Install all packages (Django included) in a single invocation,
+        # favouring wheels so nothing has to be built from source. Bytecode
+        # is compiled lazily on first import instead of during install.
+        if UV:
+            install_cmd = [UV, "pip", "install", "--python", VENV_PYTHON, "-r", "requirements.txt"]
+        else:
+            install_cmd = [
+                VENV_PYTHON, "-m", "pip", "install",
+                "--no-input",
+                "--disable-pip-version-check",
+                "--no-compile",
+                "--prefer-binary",
+                "-r", "requirements.txt",
+            ]
         try:
-            subprocess.run([venv_pip, "install", "django>=4.2.0"], check=True)
+            subprocess.run(install_cmd, check=True)
         except subprocess.CalledProcessError as e:
-            console.print("[red]Failed to install Django. Aborting.[/red]")
+            console.print(f"[red]Failed to install dependencies: {str(e)}[/red]")
             raise typer.Exit(1)
-
-        # Then install remaining packages
-        try:
-            for package in requirements[1:]:  # Skip Django since we already installed it
-                try:
-                    subprocess.run([venv_pip, "install", package], check=True)
-                except subprocess.CalledProcessError as e:
-                    console.print(f"[red]Failed to install {package}: {str(e)}[/red]")
-                    raise
-        finally:
-            # Write requirements to file for reference
-            with open("requirements.txt", "w") as f:
-                f.write("\n".join(requirements))
                                                                                                         
-        progress.update(task, completed=True)                                                            
+        progress.update(task, completed=True)
+
+    console.print("[green]✓[/green] Dependencies installed")
                                                                                                         
 def setup_django_project(project_name: str):                                                             
     """Initialize Django project structure."""                                                           
-    venv_django = "./venv/bin/django-admin" if os.name != "nt" else r".\venv\Scripts\django-admin"
-    venv_python = "./venv/bin/python" if os.name != "nt" else r".\venv\Scripts\python"
                                                                                                         
-    with console.status("[bold green]Creating Django project...") as status:                             
+    with console.status("[bold green]Creating Django project...") as status:
+        # Create project as 'config' and the main app using project_name in a
+        # single interpreter; settings aren't needed for either command
+        startproject_script = '''import sys
+from django.core.management import call_command
+
+call_command("startproject", "config", ".")
+call_command("startapp", sys.argv[1])
+'''
         try:
-            # Create project as 'config'                                                                                 
-            subprocess.run([venv_django, "startproject", "config", "."], check=True)                          
+            subprocess.run([VENV_PYTHON, "-c", startproject_script, project_name], check=True)
         except subprocess.CalledProcessError:
             console.print("[red]Failed to create Django project. Make sure Django is installed correctly.[/red]")
             raise typer.Exit(1)
-                                                                                                        
-        # Create main app using project_name                                                                                
-        subprocess.run([venv_python, "manage.py", "startapp", project_name], check=True)
+
+        # Create every scaffold directory up front; sorting puts parents first
+        scaffold_dirs = {
+            "tests",
+            "features/steps",
+            f"{project_name}/services/external",
+            f"{project_name}/templates/{project_name}",
+            f"{project_name}/static/{project_name}/css",
+            f"{project_name}/static/{project_name}/js",
+            f"{project_name}/static/{project_name}/images",
+        }
+        for dir_path in sorted(scaffold_dirs):
+            os.makedirs(dir_path, exist_ok=True)
 
         # Create tests directory structure
-        os.makedirs("tests", exist_ok=True)
         test_files = {
             "tests/__init__.py": "",
             "tests/conftest.py": '''pytest_plugins = [
@@ -148,27 +197,20 @@ def test_home_page():
     assert response.status_code == 200
 '''
         }
-        
-        for file_path, content in test_files.items():
-            with open(file_path, "w") as f:
-                f.write(content)
 
         # Create pytest.ini
-        pytest_ini_content = '''[pytest]
-DJANGO_SETTINGS_MODULE = {}.settings
+        pytest_ini_content = Template('''[pytest]
+DJANGO_SETTINGS_MODULE = $project_name.settings
 python_files = tests.py test_*.py *_tests.py
-addopts = --ds={}.settings
+addopts = --ds=$project_name.settings
 testpaths = tests
-'''.format(project_name, project_name)
-        
-        with open("pytest.ini", "w") as f:
-            f.write(pytest_ini_content)
+''').substitute(project_name=project_name)
 
         # Create setup.py
-        setup_py_content = '''from setuptools import setup, find_packages
+        setup_py_content = Template('''from setuptools import setup, find_packages
 
 setup(
-    name="{}",
+    name="$project_name",
     version="0.1",
     packages=find_packages(),
     install_requires=[
@@ -184,19 +226,8 @@ setup(
         'coverage',
     ],
 )
-'''.format(project_name)
+''').substitute(project_name=project_name)
         
-        with open("setup.py", "w") as f:
-            f.write(setup_py_content)
-        
-        # Create services directory structure in project app
-        services_dirs = [
-            f"{project_name}/services",
-            f"{project_name}/services/external",
-        ]
-        for dir_path in services_dirs:
-            os.makedirs(dir_path, exist_ok=True)
-            
         # Create service files
         service_files = {
             f"{project_name}/services/__init__.py": "",
@@ -221,40 +252,33 @@ class BaseService:
 ''',
             f"{project_name}/services/external/__init__.py": "",
         }
-        
-        for file_path, content in service_files.items():
-            with open(file_path, "w") as f:
-                f.write(content)
 
         # Create main_app/urls.py with proper namespacing
-        app_urls_content = '''from django.urls import path
+        app_urls_content = Template('''from django.urls import path
 from . import views
 
-app_name = '{project_name}'
+app_name = '$project_name'
 
 urlpatterns = [
     # Add your URL patterns here
 ]
-'''.format(project_name=project_name)
-
-        with open(f"{project_name}/urls.py", "w") as f:
-            f.write(app_urls_content)
+''').substitute(project_name=project_name)
 
         # Update project's urls.py and settings.py
-        project_urls_content = '''"""
-URL configuration for {project_name} project.
+        project_urls_content = Template('''"""
+URL configuration for $project_name project.
 """
 from django.contrib import admin
 from django.urls import path, include
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('', include('{project_name}.urls', namespace='{project_name}')),
+    path('', include('$project_name.urls', namespace='$project_name')),
 ]
-'''.format(project_name=project_name)
+''').substitute(project_name=project_name)
 
-        project_settings_content = '''"""
-Django settings for {project_name} project.
+        project_settings_content = Template('''"""
+Django settings for $project_name project.
 """
 from pathlib import Path
 
@@ -287,7 +311,7 @@ INSTALLED_APPS = [
     'behave_django',
     
     # Local apps
-    '{project_name}',  # Local app
+    '$project_name',  # Local app
 ]
 
 MIDDLEWARE = [
@@ -304,35 +328,35 @@ MIDDLEWARE = [
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
-    {{
+    {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
-        'OPTIONS': {{
+        'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
-        }},
-    }},
+        },
+    },
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
-DATABASES = {{
-    'default': {{
+DATABASES = {
+    'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }}
-}}
+    }
+}
 
 AUTH_PASSWORD_VALIDATORS = [
-    {{'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'}},
-    {{'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'}},
-    {{'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'}},
-    {{'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'}},
+    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
 AUTHENTICATION_BACKENDS = [
@@ -341,22 +365,22 @@ AUTHENTICATION_BACKENDS = [
 ]
 
 # OAuth2 Settings
-SOCIALACCOUNT_PROVIDERS = {{
-    'google': {{
-        'APP': {{
+SOCIALACCOUNT_PROVIDERS = {
+    'google': {
+        'APP': {
             'client_id': 'your-client-id',
             'secret': 'your-secret',
             'key': ''
-        }},
+        },
         'SCOPE': [
             'profile',
             'email',
         ],
-        'AUTH_PARAMS': {{
+        'AUTH_PARAMS': {
             'access_type': 'online',
-        }}
-    }}
-}}
+        }
+    }
+}
 
 SITE_ID = 1
 LOGIN_REDIRECT_URL = '/'
@@ -373,18 +397,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Testing Settings
 BEHAVE_DJANGO_TESTSERVER = True
 TEST_RUNNER = 'django.test.runner.DiscoverRunner'
-'''.format(project_name=project_name)
+''').substitute(project_name=project_name)
 
-        with open(f"{project_name}/urls.py", "w") as f:
-            f.write(project_urls_content)
-            
-        with open("config/settings.py", "w") as f:
-            f.write(project_settings_content)
-
-        # Create directory structure                                                                     
-        os.makedirs("features/steps", exist_ok=True)                                                     
-        Path("features/__init__.py").touch()                                                             
-        
         # Create environment.py with proper test setup
         environment_py_content = '''from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -420,8 +434,6 @@ def before_scenario(context, scenario):
     from django.core.management import call_command
     call_command('flush', verbosity=0, interactive=False)
 '''
-        with open("features/environment.py", "w") as f:
-            f.write(environment_py_content)
 
         # Create homepage.feature
         homepage_feature_content = '''Feature: Homepage
@@ -429,8 +441,6 @@ def before_scenario(context, scenario):
     When I visit the homepage
     Then I should see the page load successfully
 '''
-        with open("features/homepage.feature", "w") as f:
-            f.write(homepage_feature_content)
 
         # Create step definitions file
         steps_content = '''from behave import when, then
@@ -444,16 +454,6 @@ def step_impl(context):
 def step_impl(context):
     assert context.browser.current_url == context.server_url + "/"
 '''
-        with open("features/steps/homepage_steps.py", "w") as f:
-            f.write(steps_content)
-            
-        Path("features/steps/__init__.py").touch()                                                       
-                                                                                                        
-        # Create templates and static directories
-        os.makedirs(f"{project_name}/templates/{project_name}", exist_ok=True)
-        os.makedirs(f"{project_name}/static/{project_name}/css", exist_ok=True)
-        os.makedirs(f"{project_name}/static/{project_name}/js", exist_ok=True)
-        os.makedirs(f"{project_name}/static/{project_name}/images", exist_ok=True)
 
         # Create base template
         base_template = '''{% load static %}
@@ -470,15 +470,6 @@ def step_impl(context):
 </body>
 </html>
 '''
-        with open(f"{project_name}/templates/{project_name}/base.html", "w") as f:
-            f.write(base_template)
-
-        # Create initial static files
-        with open(f"{project_name}/static/{project_name}/css/style.css", "w") as f:
-            f.write("/* Add your styles here */\n")
-        
-        with open(f"{project_name}/static/{project_name}/js/main.js", "w") as f:
-            f.write("// Add your JavaScript here\n")
 
         # Create .gitignore
         gitignore_content = '''# Python
@@ -533,48 +524,75 @@ htmlcov/
 coverage.xml
 *.cover
 '''
-        with open(".gitignore", "w") as f:
-            f.write(gitignore_content)
 
-        # Initialize git                                                                                 
-        subprocess.run(["git", "init"], check=True)                                                      
+        # Create behave.ini in project root
+        behave_ini_content = '''[behave]
+paths = features
+steps = features/steps
+'''
 
-        # Run migrations
-        venv_python = "./venv/bin/python" if os.name != "nt" else r".\venv\Scripts\python"
-        console.print("\n[cyan]Running migrations...[/cyan]")
+        # Initialize git on a main branch in the background while the scaffold
+        # files are written; older gits simply ignore init.defaultBranch
+        git_init = subprocess.Popen(["git", "-c", "init.defaultBranch=main", "init", "-q"])
+
+        # Write every scaffold file in a single pass
+        scaffold_files = {
+            **test_files,
+            "pytest.ini": pytest_ini_content,
+            "setup.py": setup_py_content,
+            **service_files,
+            f"{project_name}/urls.py": app_urls_content,
+            "config/urls.py": project_urls_content,
+            "config/settings.py": project_settings_content,
+            "features/__init__.py": "",
+            "features/environment.py": environment_py_content,
+            "features/homepage.feature": homepage_feature_content,
+            "features/steps/__init__.py": "",
+            "features/steps/homepage_steps.py": steps_content,
+            f"{project_name}/templates/{project_name}/base.html": base_template,
+            f"{project_name}/static/{project_name}/css/style.css": "/* Add your styles here */\n",
+            f"{project_name}/static/{project_name}/js/main.js": "// Add your JavaScript here\n",
+            ".gitignore": gitignore_content,
+            "behave.ini": behave_ini_content,
+        }
         try:
-            subprocess.run([venv_python, "manage.py", "migrate"], check=True)
-            console.print("[green]✓[/green] Database migrations applied")
-        except subprocess.CalledProcessError:
-            console.print("[red]Failed to apply migrations[/red]")
-            raise typer.Exit(1)
-
-        # Exit any status display before superuser creation
-        console.print("[green]✓[/green] Django project created")
-
-        # Create superuser non-interactively without prompting
-        console.print("\n[cyan]Creating superuser...[/cyan]")
-        env = os.environ.copy()
-        env["DJANGO_SUPERUSER_USERNAME"] = "admin"
-        env["DJANGO_SUPERUSER_PASSWORD"] = "admin123"
-        env["DJANGO_SUPERUSER_EMAIL"] = "admin@example.com"
+            for file_path, content in scaffold_files.items():
+                Path(file_path).write_text(content)
+        finally:
+            # Reap git even if a write fails so it isn't left running
+            git_init.wait()
+
+        if git_init.returncode != 0:
+            raise subprocess.CalledProcessError(git_init.returncode, git_init.args)
+
+        # Apply migrations and create the superuser in a single Django process
+        # so settings and the app registry are only loaded once
+        db_setup_script = '''import os
+import django
+from django.core.management import call_command
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+call_command("migrate")
+call_command("createsuperuser", interactive=False)
+'''
+        console.print("\n[cyan]Running migrations and creating superuser...[/cyan]")
+        env = {
+            **os.environ,
+            "DJANGO_SUPERUSER_USERNAME": "admin",
+            "DJANGO_SUPERUSER_PASSWORD": "admin123",
+            "DJANGO_SUPERUSER_EMAIL": "admin@example.com",
+        }
 
         try:
-            subprocess.run([venv_python, "manage.py", "createsuperuser", "--noinput"], 
-                         check=True,
-                         env=env)
+            subprocess.run([VENV_PYTHON, "-c", db_setup_script], check=True, env=env)
+            console.print("[green]✓[/green] Database migrations applied")
             console.print("[green]✓[/green] Superuser 'admin' created")
         except subprocess.CalledProcessError:
-            console.print("[red]Failed to create superuser[/red]")
+            console.print("[red]Failed to apply migrations or create superuser[/red]")
             raise typer.Exit(1)
-        
-        # Create behave.ini in project root
-        behave_ini_content = '''[behave]
-paths = features
-steps = features/steps
-'''
-        with open("behave.ini", "w") as f:
-            f.write(behave_ini_content)
+
+        console.print("[green]✓[/green] Django project created")
 
 @app.command()                                                                                           
 def launch(project_name: str = typer.Argument(None, help="Name of your Django project")):                 
@@ -583,6 +601,7 @@ def launch(project_name: str = typer.Argument(None, help="Name of your Django pr
     """
     console.print(Panel(ASCII_ART, style="bold blue"))
 
+    venv_proc = None
     if project_name is None:
         project_name = typer.prompt(
             "\n" + typer.style("What would you like to name your Django project?", fg=typer.colors.CYAN, bold=True),
@@ -620,6 +639,9 @@ def launch(project_name: str = typer.Argument(None, help="Name of your Django pr
         console.print(f"\n[bold]Project name:[/bold] {project_name}")
         console.print("[bold]Description:[/bold] Creates a new Django project with BDD testing framework\n")
 
+        # Create the virtual environment while the countdown plays
+        venv_proc = start_virtual_environment()
+
         # Launch sequence countdown
         for count in range(3, 0, -1):
             console.print(f"[bold red]{count}...[/bold red]", end="\r")
@@ -631,7 +653,7 @@ def launch(project_name: str = typer.Argument(None, help="Name of your Django pr
     # Execute steps sequentially without nested progress bars
     try:
         console.print("\n[cyan]Creating virtual environment...[/cyan]")
-        create_virtual_environment()
+        create_virtual_environment(venv_proc)
         
         console.print("\n[cyan]Installing dependencies...[/cyan]")
         install_dependencies()
@@ -647,9 +669,8 @@ def launch(project_name: str = typer.Argument(None, help="Name of your Django pr
         raise typer.Exit(1)
                                                                                                         
     # Show virtual environment status
-    venv_python = "./venv/bin/python" if os.name != "nt" else r".\venv\Scripts\python"
     try:
-        version_info = subprocess.check_output([venv_python, "-V"], text=True).strip()
+        version_info = subprocess.check_output([VENV_PYTHON, "-V"], text=True).strip()
         console.print(f"\n[bold green]🚀 Launch successful![/bold green]")
         console.print(f"\n[yellow]Virtual environment is ready with {version_info}[/yellow]")
         console.print("\n[bold cyan]To activate virtual environment:[/bold cyan]")
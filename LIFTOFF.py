@@ -2,62 +2,33 @@ import typer
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.markup import escape
+import importlib.util
 import subprocess
 import sys
 import os
-import platform
-import time
+import re
+import tempfile
 
 console = Console()
 app = typer.Typer(help="Project LIFTOFF - Documentation Generator")
 commands = typer.Typer()
 app.add_typer(commands, name="")
 
+_IS_DARWIN = sys.platform == "darwin"
+INSTALL_LOG = os.path.expanduser("~/.cache/liftoff/install.log")
+_ENV_KEY_RE = re.compile(r'^ANTHROPIC_API_KEY=["\']?([^"\'\n]*)', re.MULTILINE)
+
 ASCII_ART = """
 🚀 PROJECT LIFTOFF 🚀
 ====================
 Initiating Documentation Sequence...
 """
 
-def install_vscode_cli_macos():
-    """Attempt to install VS Code CLI tools on macOS."""
-    # Check if VS Code is installed
-    vscode_path = "/Applications/Visual Studio Code.app"
-    if not os.path.exists(vscode_path):
-        console.print("[red]VS Code is not installed in /Applications.[/red]")
-        return False
-
-    cli_source = "/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code"
-    cli_target = "/usr/local/bin/code"
-
-    try:
-        # Remove existing symlink if it exists
-        if os.path.exists(cli_target):
-            console.print("[yellow]Removing existing VS Code CLI link...[/yellow]")
-            subprocess.run(['sudo', 'rm', cli_target], check=True)
-
-        # Create new symlink
-        console.print("[yellow]Installing VS Code CLI tools...[/yellow]")
-        subprocess.run(['sudo', 'ln', '-s', cli_source, cli_target], check=True)
-        
-        # Verify installation
-        result = subprocess.run(['which', 'code'], capture_output=True, text=True)
-        if result.stdout.strip():
-            console.print("[green]Successfully installed VS Code command line tools.[/green]")
-            return True
-        else:
-            console.print("[red]Installation seemed to succeed but 'code' command not found.[/red]")
-            return False
-            
-    except subprocess.CalledProcessError as e:
-        console.print(f"[red]Failed to install VS Code command line tools: {str(e)}[/red]")
-        return False
-
 def open_markdown(file_path):
     """Open a markdown file in the default viewer."""
     try:
-        if platform.system() == 'Darwin':  # macOS
+        if _IS_DARWIN:
             subprocess.run(['open', file_path], check=True)
             return True
         else:
@@ -67,13 +38,13 @@ def open_markdown(file_path):
         console.print(f"[red]Failed to open {file_path}[/red]")
         return False
 
-def fill_mission(use_voice=False, debug=False, dry_run=False):
+def fill_mission(use_voice=False, debug=False, dry_run=False, batch=False):
     """Use aider to fill out MISSION.md"""
     console.print("\n[cyan]Let's define the mission of your project.[/cyan]")
     console.print("[yellow]First, review the current MISSION.md[/yellow]")
     
     # Open MISSION.md in default markdown viewer
-    if open_markdown("MISSION.md"):
+    if open_markdown("MISSION.md") and not batch:
         # Wait for user to indicate they're ready to proceed
         Prompt.ask("\nPress Enter when you've reviewed the mission", default="")
     
@@ -81,8 +52,36 @@ def fill_mission(use_voice=False, debug=False, dry_run=False):
     
     mission_prompt = """Please help complete the remaining sections in MISSION.md based on the GOAL that's already defined. Write detailed, specific content for each section."""
 
-    run_aider(mission_prompt, ["MISSION.md"], debug=debug, dry_run=dry_run)
-    raise typer.Exit()
+    run_aider(mission_prompt, ["MISSION.md"], debug=debug, dry_run=dry_run, batch=batch)
+
+def read_env_key(env_path):
+    """Return ANTHROPIC_API_KEY from a .env file, or None if it isn't there."""
+    try:
+        with open(env_path, 'r') as f:
+            match = _ENV_KEY_RE.search(f.read())
+    except FileNotFoundError:
+        return None
+    return match.group(1).strip() if match else None
+
+def save_env_key(env_path, api_key):
+    """Store ANTHROPIC_API_KEY in a .env file, replacing any existing entry."""
+    try:
+        with open(env_path, 'r') as f:
+            lines = [line for line in f.read().splitlines()
+                     if not line.startswith('ANTHROPIC_API_KEY=')]
+    except FileNotFoundError:
+        lines = []
+    lines.append(f'ANTHROPIC_API_KEY="{api_key}"')
+
+    # mkstemp creates the file as 0600; os.replace swaps it in atomically
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(env_path), prefix='.env.')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, env_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 def check_api_key():
     """Check if ANTHROPIC_API_KEY is set, load from .env if exists, or prompt user."""
@@ -90,13 +89,7 @@ def check_api_key():
     
     # If not in environment, try to load from .env
     if not api_key:
-        env_path = os.path.join(os.getcwd(), '.env')
-        if os.path.exists(env_path):
-            with open(env_path, 'r') as f:
-                for line in f:
-                    if line.startswith('ANTHROPIC_API_KEY='):
-                        api_key = line.split('=')[1].strip().strip('"').strip("'")
-                        break
+        api_key = read_env_key(os.path.join(os.getcwd(), '.env'))
     
     # If still no API key, prompt user and save to .env
     if not api_key:
@@ -104,62 +97,101 @@ def check_api_key():
         api_key = Prompt.ask("Please enter your Anthropic API key")
         
         # Save to .env file
-        env_path = os.path.join(os.getcwd(), '.env')
-        with open(env_path, 'a') as f:
-            f.write(f'\nANTHROPIC_API_KEY="{api_key}"')
+        save_env_key(os.path.join(os.getcwd(), '.env'), api_key)
         console.print("[green]API key saved to .env file[/green]")
     
     # Set for current session
     os.environ['ANTHROPIC_API_KEY'] = api_key
     return True
 
+def read_log_tail(path, size=4096):
+    """Return the last ``size`` bytes of a log file as text."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - size, 0))
+        return f.read().decode(errors='replace')
+
+_progress = None
+
+def get_progress():
+    """Return the spinner shared by all commands, creating it on first use."""
+    global _progress
+    if _progress is None:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        _progress = Progress(
+            SpinnerColumn(speed=0.5),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            refresh_per_second=4,
+            transient=True
+        )
+    return _progress
+
 def check_aider_installation():
     """Check if aider is installed and accessible, install if missing."""
-    try:
-        import aider
+    # find_spec only locates the package; importing aider would pull in litellm
+    if importlib.util.find_spec("aider") is not None:
         # Check API key after confirming aider is installed
         return check_api_key()
-    except ImportError:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("[yellow]Installing Droid Assistant...[/yellow]", total=None)
-            try:
-                # Install aider with all optional dependencies
-                subprocess.run([sys.executable, "-m", "pip", "install", "aider-chat[all]>=0.71.1"], 
-                             check=True,
-                             capture_output=True)
-                progress.stop()
-                console.print("[green]Successfully installed Droid Assistant.[/green]")
-                return True
-            except subprocess.CalledProcessError as e:
-                progress.stop()
-                console.print("[red]Failed to install Droid Assistant.[/red]")
-                console.print(f"[red]Error: {str(e)}[/red]")
-                return False
+
+    with get_progress() as progress:
+        task = progress.add_task("[yellow]Installing Droid Assistant...[/yellow]", total=None)
+        try:
+            # Install aider with all optional dependencies, using wheels where
+            # possible; pip's own cache makes repeat installs cheap. Output is
+            # streamed to a log file rather than buffered in memory, and the
+            # latest line is shown next to the spinner as it arrives.
+            os.makedirs(os.path.dirname(INSTALL_LOG), exist_ok=True)
+            with open(INSTALL_LOG, 'ab') as log:
+                proc = subprocess.Popen(
+                    [sys.executable, "-m", "pip", "install", "--prefer-binary", "aider-chat[all]>=0.71.1"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT
+                )
+                for line in proc.stdout:
+                    log.write(line)
+                    status = escape(line.decode(errors='replace').strip()[:60])
+                    progress.update(task, description=f"[yellow]Installing Droid Assistant...[/yellow] {status}")
+                if proc.wait() != 0:
+                    raise subprocess.CalledProcessError(proc.returncode, proc.args)
+            progress.stop()
+            console.print("[green]Successfully installed Droid Assistant.[/green]")
+            # Check API key now that aider is installed
+            return check_api_key()
+        except subprocess.CalledProcessError as e:
+            progress.stop()
+            console.print("[red]Failed to install Droid Assistant.[/red]")
+            console.print(f"[red]Error: {escape(str(e))}[/red]")
+            console.print(read_log_tail(INSTALL_LOG), style="red", markup=False)
+            console.print(f"[yellow]Full install log: {INSTALL_LOG}[/yellow]")
+            return False
+        except OSError as e:
+            # The log location may be unwritable (read-only home, sandbox)
+            progress.stop()
+            console.print("[red]Failed to install Droid Assistant.[/red]")
+            console.print(f"[red]Error: {escape(str(e))}[/red]")
+            return False
+        finally:
+            # Drop the task so the shared spinner starts clean for aider
+            progress.remove_task(task)
 
 
-def run_aider(prompt, files_to_add, use_voice=False, debug=False, dry_run=False):
+def run_aider(prompt, files_to_add, use_voice=False, debug=False, dry_run=False, batch=False):
     """Run Droid Assistant using aider's Python API."""
     if not check_aider_installation():
         console.print("[red]Failed to setup required components.[/red]")
         raise typer.Exit(code=1)
         
+    # Imported here so commands that never talk to aider skip its import cost
     from aider.coders import Coder
     from aider.models import Model
     from aider.io import InputOutput
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with get_progress() as progress:
+        # Create a progress task
+        task = progress.add_task("Droid is thinking...", total=None)
         try:
-            # Create a progress task
-            task = progress.add_task("Droid is thinking...", total=None)
-            
             # Initialize aider components
             model = Model("claude-3-5-sonnet-20241022")
             io = InputOutput(yes=True)  # Auto-confirm changes
@@ -179,42 +211,44 @@ def run_aider(prompt, files_to_add, use_voice=False, debug=False, dry_run=False)
             if dry_run:
                 console.print("[yellow]Running in dry-run mode - no files will be modified[/yellow]")
             
-            # Execute the prompt
+            # Remember MISSION.md's mtime so it is only re-read if aider edits it
+            try:
+                mission_mtime = os.path.getmtime("MISSION.md")
+            except OSError:
+                mission_mtime = None
+
+            # Execute the prompt; the repo map is refreshed once per session
             progress.stop()
             coder.run("/map-refresh")
             result = coder.run(prompt)
-            coder.run("/map-refresh")
             
             if debug:
                 console.print("[dim]Aider completed processing[/dim]")
             
             # Check if MISSION.md was modified
             try:
-                with open("MISSION.md", "r") as f:
-                    current_content = f.read()
-                    if "[Describe the specific problem" not in current_content:
-                        console.print("[green]✓ Mission sections have been updated[/green]")
+                if os.path.getmtime("MISSION.md") != mission_mtime:
+                    with open("MISSION.md", "r") as f:
+                        current_content = f.read()
+                        if "[Describe the specific problem" not in current_content:
+                            console.print("[green]✓ Mission sections have been updated[/green]")
             except Exception as e:
                 if debug:
                     console.print(f"[red]Error checking MISSION.md: {str(e)}[/red]")
             
-            # Ask about additional changes
-            while True:
-                more_changes = Prompt.ask("\nWould you like to make more changes?", choices=["y", "n"], default="n")
-                if more_changes.lower() == "n":
-                    break
-                
-                new_prompt = Prompt.ask("What changes would you like to make")
+            # Ask about additional changes unless running in batch mode
+            while not batch and typer.confirm("\nWould you like to make more changes?", default=False):
+                new_prompt = typer.prompt("What changes would you like to make")
                 if new_prompt.lower() == "none":
                     break
                     
                 progress.start()
                 progress.update(task, description="Droid is thinking...")
-                coder.run("/map-refresh")
                 result = coder.run(new_prompt)
                 progress.stop()
                 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, typer.Abort):
+            # typer.confirm/typer.prompt raise Abort on Ctrl-C or EOF
             progress.stop()
             console.print("\n[yellow]Operation cancelled by user.[/yellow]")
             raise typer.Exit(code=1)
@@ -222,28 +256,33 @@ def run_aider(prompt, files_to_add, use_voice=False, debug=False, dry_run=False)
             progress.stop()
             console.print(f"[red]Error running aider: {str(e)}[/red]")
             raise typer.Exit(code=1)
+        finally:
+            # Drop the task so a later run starts with a single spinner row
+            progress.remove_task(task)
 
 @app.command(help="Launch the documentation process")
 def launch(
     debug: bool = typer.Option(False, "--debug", help="Enable debug output"),
     voice: bool = typer.Option(False, "--voice", help="Enable voice interaction"),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Preview changes without modifying files")
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview changes without modifying files"),
+    batch: bool = typer.Option(False, "--batch", help="Run the first prompt only, without follow-up questions")
 ):
     """Launch the documentation process."""
     console.print(Panel(ASCII_ART, style="bold blue"))
     
     # Fill out the mission and exit
     console.print("\n[bold cyan]Step 1: Defining the Mission[/bold cyan]")
-    fill_mission(use_voice=voice, debug=debug, dry_run=dry_run)
+    fill_mission(use_voice=voice, debug=debug, dry_run=dry_run, batch=batch)
 
 @app.callback(invoke_without_command=True)
 def main(ctx: typer.Context,
     debug: bool = typer.Option(False, "--debug", help="Enable debug output"),
     voice: bool = typer.Option(False, "--voice", help="Enable voice interaction"),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Preview changes without modifying files")):
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview changes without modifying files"),
+    batch: bool = typer.Option(False, "--batch", help="Run the first prompt only, without follow-up questions")):
     """Main callback that runs if no command is provided"""
     if ctx.invoked_subcommand is None:
-        launch(debug=debug, voice=voice, dry_run=dry_run)
+        launch(debug=debug, voice=voice, dry_run=dry_run, batch=batch)
 
 if __name__ == "__main__":
     app()
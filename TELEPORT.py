@@ -52,9 +52,10 @@ def add_and_commit_files(directory, files):
     # Clear any existing staged files
     subprocess.run(["git", "reset"], cwd=directory)
 
-    for file in files:    
+    for file in files:
         print(f"Adding file: {file}")
-        subprocess.run(["git", "add", file], cwd=directory)
+    # Stage everything with one git process instead of one per file
+    subprocess.run(["git", "add", "--", *files], cwd=directory)
     result = subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=directory, capture_output=True, text=True)
     print("Git commit output:", result.stdout, result.stderr)
 